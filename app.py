@@ -1,26 +1,76 @@
 #!/usr/bin/env python3
 import argparse
 import csv
-import json
+import functools
+import itertools
 import logging
 import os
+import queue
+import re
 import shutil
 import subprocess
 import sys
-import tempfile
-from typing import List, Optional
-
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import ijson
+import requests
 from atlassian import Jira
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 DEFAULT_API_VER = 2
 LIMIT_DEFAULT = 100000
 JIRA_PROJECT_DEFAULT = "https://redpandadata.atlassian.net"
 API_BASE = '{url}/rest/api/{api_version}'
+GITHUB_API_URL = 'https://api.github.com'
+GITHUB_PER_PAGE = 100
 CSV_GITHUB_USERNAME = 'Github Username'
 CSV_NAME = 'Name'
 CSV_EMAIL = 'Email'
 EXPECTED_FIELD_NAMES = [CSV_GITHUB_USERNAME, CSV_NAME, CSV_EMAIL]
 JIRA_ISSUE_CHARACTER_LIMIT = 32767
+JIRA_GITHUB_URL_FIELD = 'customfield_10052'
+BUG_LABEL = 'kind/bug'
+BACKPORT_LABEL = 'kind/backport'
+# Jira labels cannot contain spaces
+LABEL_TRANSLATION = str.maketrans(' ', '-')
+# URLs per JQL "in (...)" clause, bounds the size of each search
+JQL_URL_CHUNK_SIZE = 100
+JQL_MAX_RESULTS = 100
+JIRA_COMMENTS_PER_UPDATE = 50
+# Issues fetched ahead of the import workers, bounds memory while the
+# listing is still streaming in
+ISSUE_QUEUE_SIZE = 64
+GHM_CACHE_MAXSIZE = 2048
+# Matches the Jira markup delimiters of code and noformat blocks
+JIRA_BLOCK_DELIMITER = re.compile(r'\{(?:code|noformat)(?::[^}]*)?\}')
+# Matches markdown link reference definitions and footnote definitions
+GHM_REFERENCE_DEFINITION = re.compile(r'^ {0,3}\[[^\]]+\]:', re.MULTILINE)
+IMPORT_WORKERS_DEFAULT = 8
+USER_LOOKUP_WORKERS = 16
+# Same as the atlassian client's default, requests has no timeout otherwise
+HTTP_TIMEOUT = 75
+HTTP_RETRY_TOTAL = 5
+HTTP_RETRY_BACKOFF_FACTOR = 0.5
+# Only retried for idempotent methods, the request may have been processed
+HTTP_RETRY_STATUS_CODES = [502, 503, 504]
+# PUT is left out, the issue edits that add comments are not idempotent
+HTTP_RETRY_METHODS = Retry.DEFAULT_ALLOWED_METHODS - {'PUT'}
+BOILERPLATE_MESSAGE = """
+JIRA Issue created from GitHub issue.  Any updates in JIRA will _not_ be pushed back
+to the GitHub issue.  New comments from GitHub will sync with JIRA issue, but not
+modifications.  Please refer to the External GitHub Link field to get to the GitHub
+issue that triggered this issue's creation.
+"""
+TRUNCATED_MESSAGE = """
+The issue has been truncated due to issue length limitations.
+Please refer to the original Github issue for the full issue body.
+"""
 
 
 class NoUserExists(Exception):
@@ -34,8 +84,23 @@ class NoUserExists(Exception):
         return self._email
 
 
+class RateLimitRetry(Retry):
+    # A rate limited request was never processed, so unlike 5xx responses it
+    # is safe to retry whatever the method, including issue creation POSTs
+    # and Github PATCHes.  Github reports secondary rate limits as a 403 with
+    # Retry-After.  Retry-After is honoured when sleeping between attempts.
+
+    def is_retry(self,
+                 method: str,
+                 status_code: int,
+                 has_retry_after: bool = False) -> bool:
+        if status_code == 429 or (status_code == 403 and has_retry_after):
+            return True
+        return super().is_retry(method, status_code, has_retry_after)
+
+
 class GithubIssueImport(object):
-    _issue_list_pattern = 'gh issue list -R {repo} --json title,labels,url,body,comments,number,author,assignees -L {limit}'
+    _issue_list_fields = 'title,labels,url,body,comments,number,author,assignees'
     _null_panda_email = 'noreply@redpanda.com'
 
     def __init__(self,
@@ -46,9 +111,11 @@ class GithubIssueImport(object):
                  jira_token: str,
                  jira_url: str,
                  jira_project: str,
-                 user_mapper: csv.DictReader,
+                 user_mapper: Iterable[dict],
                  pandoc: Optional[str],
-                 add_link: bool = True):
+                 add_link: bool = True,
+                 github_token: Optional[str] = None,
+                 workers: int = IMPORT_WORKERS_DEFAULT):
         self._logger = logger
         self._github_repo = github_repo
         self._limit = limit
@@ -56,16 +123,69 @@ class GithubIssueImport(object):
         self._jira_token = jira_token
         self._jira_url = jira_url
         self._jira_project = jira_project
+        # The parts of the create issue payload that never change between
+        # issues are built once and shared by every request
+        self._project_field = {"key": self._jira_project}
+        self._issue_type_fields = {
+            issue_type: {
+                "name": issue_type
+            }
+            for issue_type in ("Bug", "Task")
+        }
+        # URL prefixes are formatted once instead of on every request
+        self._jira_browse_url = f'{self._jira_url}/browse/'
+        self._gh_repo_url = f'{GITHUB_API_URL}/repos/{self._github_repo}'
+        self._gh_issues_url = f'{self._gh_repo_url}/issues'
         self._pandoc = pandoc
+        # Headings get no generated identifiers.  They are made unique across
+        # the whole document, so a batched conversion would number a heading
+        # repeated between documents differently than a single one
+        self._pandoc_cmd = [
+            pandoc, '-f', 'gfm-auto_identifiers-gfm_auto_identifiers', '-w',
+            'jira'
+        ]
         self._add_link = add_link
+        # Holds mapping of Github markdown to its Jira conversion
+        self._ghm_cache: 'OrderedDict[str, str]' = OrderedDict()
+        self._ghm_cache_lock = threading.Lock()
+        self._workers = workers
+        # The boilerplate comments never change, so convert them once rather
+        # than running pandoc over the same text for every issue
+        self._boilerplate_comment = self._ghm_to_jira(BOILERPLATE_MESSAGE)
+        self._truncated_boilerplate_comment = self._ghm_to_jira(
+            BOILERPLATE_MESSAGE + TRUNCATED_MESSAGE)
+        # Single pooled session so every Jira call reuses the same
+        # keep-alive connections instead of paying for a new TLS handshake.
+        # It serves the import workers and the producer's JQL searches, and
+        # the user lookups at startup
+        self._session = self._create_session(
+            max(USER_LOOKUP_WORKERS, workers + 1))
         self._jira = Jira(url=self._jira_url,
                           username=self._jira_user,
                           password=self._jira_token,
-                          cloud=True)
+                          cloud=True,
+                          session=self._session)
+        # When a Github token is provided, talk to the Github REST API directly
+        # rather than spawning a `gh` process for every issue
+        self._gh_session = None
+        if github_token is not None:
+            # Serves the page fetches of the listing alongside the import
+            # workers, plus the thread consuming the listing
+            self._gh_session = self._create_session(2 * workers + 1)
+            self._gh_session.headers.update({
+                'Authorization': f'Bearer {github_token}',
+                'Accept': 'application/vnd.github+json'
+            })
+        # Holds mapping of email to Jira account id, or None if no user exists
+        self._user_cache: Dict[str, Optional[str]] = {}
+        rows = list(user_mapper)
+        self._prefetch_jira_users({self._null_panda_email} |
+                                  {row[CSV_EMAIL]
+                                   for row in rows})
         self._null_panda_user = self._get_jira_user(self._null_panda_email)
         # Holds mapping of Github user name to the Jira user
         # If the Github user does not exist in Jira, NullPanda is used instead
-        self._mapped_users = self._create_user_mapping(user_mapper,
+        self._mapped_users = self._create_user_mapping(rows,
                                                        self._null_panda_user)
 
     def _create_issue(self,
@@ -73,78 +193,283 @@ class GithubIssueImport(object):
                       summary: str,
                       issue_type: str,
                       labels: [str],
-                      project_key: str,
                       issue_url: str,
-                      assignee: str = None):
+                      assignee: str = None) -> requests.Response:
         fields = {
             "description": description,
             "summary": summary,
-            "issuetype": {
-                "name": issue_type
-            },
+            "issuetype": self._issue_type_fields[issue_type],
             "labels": labels,
-            "project": {
-                "key": project_key
-            },
-            "customfield_10052": issue_url
+            "project": self._project_field,
+            JIRA_GITHUB_URL_FIELD: issue_url
         }
 
         if assignee is not None:
             fields["assignee"] = {"id": assignee}
 
-        return self._jira.issue_create(fields=fields)
+        # Raw response rather than issue_create(), which raises on any error
+        # and leaves no way to retry a rejected assignee
+        return self._jira.post(self._jira.resource_url("issue"),
+                               data={"fields": fields},
+                               advanced_mode=True)
+
+    @staticmethod
+    def _create_session(pool_maxsize: int) -> requests.Session:
+        session = requests.Session()
+        retries = RateLimitRetry(total=HTTP_RETRY_TOTAL,
+                                 backoff_factor=HTTP_RETRY_BACKOFF_FACTOR,
+                                 status_forcelist=HTTP_RETRY_STATUS_CODES,
+                                 allowed_methods=HTTP_RETRY_METHODS)
+        # The pool has to hold a connection per concurrent request, otherwise
+        # connections beyond the pool size are closed after every request
+        session.mount(
+            'https://',
+            HTTPAdapter(pool_connections=1,
+                        pool_maxsize=pool_maxsize,
+                        max_retries=retries))
+        return session
+
+    def _create_user_mapping(self, rows: List[dict], default_user: str):
+        return {
+            row[CSV_GITHUB_USERNAME]:
+            self._get_jira_user_with_default(row[CSV_EMAIL], default_user)
+            for row in rows
+        }
 
-    def _create_user_mapping(self, user_mapper: csv.DictReader,
-                             default_user: str):
-        rv = {}
-        for row in user_mapper:
-            rv[row[CSV_GITHUB_USERNAME]] = self._get_jira_user_with_default(
-                row[CSV_EMAIL], default_user)
-        return rv
+    def _prefetch_jira_users(self, emails: Set[str]):
+        # Resolves every unique email (NullPanda included) concurrently into
+        # the user cache, so building the mapping afterwards never blocks
+        with ThreadPoolExecutor(max_workers=USER_LOOKUP_WORKERS) as executor:
+            list(
+                executor.map(
+                    lambda email: self._get_jira_user_with_default(
+                        email, None), emails))
 
     def _ghm_to_jira(self, ghm: str):
         if self._pandoc is not None:
-            with tempfile.NamedTemporaryFile(delete=False) as tf:
-                tf.write(ghm.encode())
-                tf.flush()
-                tf.close()
-                jmd = self._run_cmd_return_stdout(
-                    f'{self._pandoc} -f gfm -w jira {tf.name}')
-                os.unlink(tf.name)
-                return jmd
+            # pandoc reads the markdown from stdin, no temporary file needed.
+            # Surrounding newlines are dropped so a single conversion matches
+            # a piece split out of a batched one
+            return self._run_cmd(self._pandoc_cmd, ghm).strip('\n')
         return ghm
 
+    def _ghm_to_jira_batch(self, body: str,
+                           comments: List[str]) -> Tuple[str, List[str]]:
+        if self._pandoc is None:
+            return body, comments
+        # Bot comments repeat verbatim across issues, only run pandoc over
+        # comments that haven't been converted yet.  Bodies are not cached.
+        jmds = {}
+        with self._ghm_cache_lock:
+            for ghm in comments:
+                if ghm in self._ghm_cache:
+                    self._ghm_cache.move_to_end(ghm)
+                    jmds[ghm] = self._ghm_cache[ghm]
+        misses = [ghm for ghm in dict.fromkeys(comments) if ghm not in jmds]
+        jmd_body, *converted = self._convert_ghm_batch([body] + misses)
+        if len(misses) > 0:
+            jmds.update(zip(misses, converted))
+            with self._ghm_cache_lock:
+                for ghm, jmd in zip(misses, converted):
+                    self._ghm_cache[ghm] = jmd
+                    self._ghm_cache.move_to_end(ghm)
+                    if len(self._ghm_cache) > GHM_CACHE_MAXSIZE:
+                        # Evict the least recently used entry
+                        self._ghm_cache.popitem(last=False)
+        return jmd_body, [jmds[ghm] for ghm in comments]
+
+    def _convert_ghm_batch(self, ghms: List[str]) -> List[str]:
+        # Link reference definitions and footnotes are document wide, once
+        # joined they would resolve across documents
+        if len(ghms) < 2 or any(
+                GHM_REFERENCE_DEFINITION.search(ghm) for ghm in ghms):
+            return [self._ghm_to_jira(ghm) for ghm in ghms]
+        # Convert all of the documents with a single pandoc run by separating
+        # them with a marker paragraph that comes out of pandoc unchanged
+        marker = f'PANDOCSPLIT{uuid.uuid4().hex}'
+        jmds = self._ghm_to_jira(f'\n\n{marker}\n\n'.join(ghms)).split(marker)
+        # A document that leaves a block open (e.g. an unterminated code
+        # fence) swallows the markers after it, convert one by one instead
+        if len(jmds) != len(ghms) or any(
+                len(JIRA_BLOCK_DELIMITER.findall(jmd)) % 2 != 0
+                for jmd in jmds):
+            self._logger.debug(
+                'Batched pandoc conversion failed to split, converting %d documents individually',
+                len(ghms))
+            return [self._ghm_to_jira(ghm) for ghm in ghms]
+        return [jmd.strip('\n') for jmd in jmds]
+
+    def close(self):
+        self._session.close()
+        if self._gh_session is not None:
+            self._gh_session.close()
+
     def run(self):
         self._logger.info(
-            f'Starting run, collecting Github Issues from {self._github_repo} and importing into project {self._jira_project} at {self._jira_url}'
-        )
-        self._logger.debug(f'Fetching open issues from {self._github_repo}')
+            'Starting run, collecting Github Issues from %s and importing into project %s at %s',
+            self._github_repo, self._jira_project, self._jira_url)
+        self._logger.debug('Fetching open issues from %s', self._github_repo)
         issues = self._collect_issues()
-        self._logger.debug(
-            f'There are {len(issues)} issues open in {self._github_repo}')
         self._logger.debug('Starting import process')
         self._import_issues(issues)
 
-    def _add_comment_to_issue(self, issue_id, comment):
-        comment = self._ghm_to_jira(comment)
-        self._logger.debug(f'Adding comment "{comment}" to issue {issue_id}')
-        self._jira.issue_add_comment(issue_key=issue_id, comment=comment)
+    def _add_comments_to_issue(self, issue_id, comments: List[str]):
+        # Rather than one POST per comment, add them through the issue edit
+        # endpoint which takes a list of comment operations and applies them
+        # in order.  PUTs are never retried on 5xx, so a comment cannot be
+        # duplicated by a retry after Jira already applied the edit
+        for i in range(0, len(comments), JIRA_COMMENTS_PER_UPDATE):
+            ops = [{
+                "add": {
+                    "body": comment
+                }
+            } for comment in comments[i:i + JIRA_COMMENTS_PER_UPDATE]]
+            self._logger.debug('Adding %d comments to issue %s', len(ops),
+                               issue_id)
+            self._jira.put(self._jira.resource_url(f"issue/{issue_id}"),
+                           data={"update": {
+                               "comment": ops
+                           }})
+
+    def _collect_issues(self) -> Iterator[dict]:
+        # The newest `limit` open issues are imported, oldest first.
+        # `gh issue list` only lists newest first (sorting through --search
+        # caps the listing at 1000 issues), so its listing is reversed in
+        # memory.  The REST API does the same unless every open issue fits in
+        # the limit, in which case it lists oldest first and the issues stream
+        # straight into the import.
+        if self._gh_session is None:
+            return reversed(list(self._iter_issues_from_gh()))
+        if self._open_issues_count() <= self._limit:
+            return self._iter_issues_from_api('asc')
+        return reversed(list(self._iter_issues_from_api('desc')))
+
+    def _open_issues_count(self) -> int:
+        resp = self._gh_session.get(self._gh_repo_url, timeout=HTTP_TIMEOUT)
+        resp.raise_for_status()
+        # Counts open pull requests as well, so it is an upper bound
+        return resp.json()["open_issues_count"]
+
+    def _iter_issues_from_gh(self) -> Iterator[dict]:
+        cmd = [
+            'gh', 'issue', 'list', '-R', self._github_repo, '--json',
+            self._issue_list_fields, '-L',
+            str(self._limit)
+        ]
+        self._log_cmd(cmd)
+        # Decode issues one at a time from the pipe rather than buffering the
+        # entire JSON document (bodies and comments included) in memory
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE) as proc:
+            try:
+                yield from ijson.items(proc.stdout, 'item', use_float=True)
+            except ijson.JSONError:
+                # A failing gh cuts the listing short, its exit status is the
+                # real error rather than the truncated JSON
+                if proc.wait() == 0:
+                    raise
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+    def _iter_issues_from_api(self, direction: str) -> Iterator[dict]:
+        get_page = functools.partial(self._get_issues_page,
+                                     direction=direction)
+        first_page = get_page(1)
+        issues = self._issues_from_page(first_page)
+        # The "last" link tells how many pages there are, so the remaining pages
+        # can be requested side by side instead of following "next" links.
+        # Pull requests are dropped from each page, so pages are fetched a
+        # batch at a time until enough issues have been yielded.
+        remaining_pages = iter(range(2, self._last_page(first_page) + 1))
+        count = 0
+        with ThreadPoolExecutor(max_workers=self._workers) as executor:
+            while True:
+                for issue in issues:
+                    if count == self._limit:
+                        return
+                    count += 1
+                    yield issue
+                pages = list(itertools.islice(remaining_pages, self._workers))
+                if len(pages) == 0:
+                    return
+                issues = itertools.chain.from_iterable(
+                    map(self._issues_from_page,
+                        executor.map(get_page, pages)))
+
+    def _get_issues_page(self, page: int,
+                         direction: str) -> requests.Response:
+        resp = self._gh_session.get(self._gh_issues_url,
+                                    params={
+                                        'state': 'open',
+                                        'sort': 'created',
+                                        'direction': direction,
+                                        'per_page': GITHUB_PER_PAGE,
+                                        'page': page
+                                    },
+                                    timeout=HTTP_TIMEOUT)
+        resp.raise_for_status()
+        return resp
+
+    @staticmethod
+    def _last_page(resp: requests.Response) -> int:
+        last = resp.links.get('last')
+        if last is None:
+            return 1
+        return int(parse_qs(urlparse(last['url']).query)['page'][0])
+
+    def _issues_from_page(self, resp: requests.Response) -> List:
+        # The issues endpoint also returns pull requests, `gh issue list` does not
+        return [
+            self._issue_from_api(issue) for issue in resp.json()
+            if 'pull_request' not in issue
+        ]
+
+    @staticmethod
+    def _issue_from_api(issue) -> dict:
+        # Shape the REST API issue like the output of `gh issue list`.  Comments
+        # are not part of the listing, they are fetched once the issue is imported
+        return {
+            "title": issue["title"],
+            "labels": issue["labels"],
+            "url": issue["html_url"],
+            "body": issue["body"] or "",
+            "comments": [] if issue["comments"] == 0 else None,
+            "comments_url": issue["comments_url"],
+            "number": issue["number"],
+            "author": issue["user"],
+            "assignees": issue["assignees"]
+        }
 
-    def _collect_issues(self) -> List:
-        return json.loads(
-            self._run_cmd_return_stdout(
-                self._issue_list_pattern.format(repo=self._github_repo,
-                                                limit=self._limit)))
+    def _get_issue_comments(self, issue) -> List:
+        if issue["comments"] is not None:
+            return issue["comments"]
+        comments = []
+        url = issue["comments_url"]
+        params = {'per_page': GITHUB_PER_PAGE}
+        while url is not None:
+            resp = self._gh_session.get(url,
+                                        params=params,
+                                        timeout=HTTP_TIMEOUT)
+            resp.raise_for_status()
+            comments.extend(resp.json())
+            url = resp.links.get('next', {}).get('url')
+            params = None
+        return comments
 
     def _get_jira_user(self, email: str) -> str:
-        self._logger.debug(f'Querying JIRA for user with email {email}')
-        resp = self._jira.user_find_by_user_string(query=email)
-        if len(resp) == 0:
+        if email in self._user_cache:
+            account_id = self._user_cache[email]
+        else:
+            self._logger.debug('Querying JIRA for user with email %s', email)
+            resp = self._jira.user_find_by_user_string(query=email)
+            account_id = resp[0]["accountId"] if len(resp) > 0 else None
+            # Misses are cached too so unknown emails are only queried once
+            self._user_cache[email] = account_id
+
+        if account_id is None:
             raise NoUserExists(email=email)
 
-        self._logger.debug(
-            f'Jira user with email {email}: {resp[0]["accountId"]}')
-        return resp[0]["accountId"]
+        self._logger.debug('Jira user with email %s: %s', email, account_id)
+        return account_id
 
     def _get_jira_user_with_default(self, email: str,
                                     default_user: str) -> str:
@@ -153,108 +478,189 @@ class GithubIssueImport(object):
         except NoUserExists:
             return default_user
 
-    def _import_issues(self, issues: List):
-        self._logger.debug(
-            f'Starting to import {len(issues)} issues into project {self._jira_project} at {self._jira_url}'
-        )
+    def _import_issues(self, issues: Iterable[dict]):
+        self._logger.debug('Starting to import issues into project %s at %s',
+                           self._jira_project, self._jira_url)
+
+        issues = iter(issues)
+        # The listing (and the Jira lookups for it) is produced on this thread
+        # while the workers consume issues from a bounded queue, so fetching
+        # from Github and importing into Jira overlap.  Issues are independent
+        # of each other, so fan out at the issue level.  Everything for a
+        # single issue (creation, then its comments in order) still happens
+        # sequentially within one worker.
+        issue_queue = queue.Queue(maxsize=ISSUE_QUEUE_SIZE)
+        failed = threading.Event()
+        errors = []
+
+        def consume():
+            while (item := issue_queue.get()) is not None:
+                # After a failure keep draining so the producer never blocks
+                if failed.is_set():
+                    continue
+                try:
+                    self._import_issue(*item)
+                except Exception as e:
+                    errors.append(e)
+                    failed.set()
+
+        with ThreadPoolExecutor(max_workers=self._workers) as executor:
+            for _ in range(self._workers):
+                executor.submit(consume)
+            try:
+                # Already imported issues are looked up a chunk at a time as
+                # the listing streams in
+                for chunk in iter(
+                        lambda: list(itertools.islice(issues, JQL_URL_CHUNK_SIZE)),
+                    []):
+                    already_imported = self._find_imported_urls(
+                        [issue['url'] for issue in chunk])
+                    for issue in chunk:
+                        if failed.is_set():
+                            break
+                        issue_queue.put((issue, already_imported))
+                    if failed.is_set():
+                        break
+            except BaseException:
+                # Includes KeyboardInterrupt, the workers must not go on to
+                # import whatever is still queued
+                failed.set()
+                raise
+            finally:
+                for _ in range(self._workers):
+                    issue_queue.put(None)
+
+        if len(errors) > 0:
+            raise errors[0]
+
+    def _import_issue(self, issue, already_imported: Set[str]):
+        if issue['url'] in already_imported:
+            self._logger.info('Skipping issue %s', issue["number"])
+            return
+        labels = [
+            label['name'].translate(LABEL_TRANSLATION)
+            for label in issue["labels"]
+        ]
+        label_set = frozenset(labels)
+        issue_type = "Bug" if BUG_LABEL in label_set else "Task"
+        assignee = None
+        if len(issue["assignees"]) > 0:
+            assignee = self._mapped_users.get(
+                issue["assignees"][0]["login"], self._null_panda_user)
+
+        # The body and every comment go through pandoc together
+        issue_body, comments = self._ghm_to_jira_batch(
+            issue["body"],
+            [c['body'] for c in reversed(self._get_issue_comments(issue))])
+
+        issue_cut_off = len(issue_body) > JIRA_ISSUE_CHARACTER_LIMIT
 
-        for issue in reversed(issues):
-            self._logger.debug(
-                f"Checking to see if a JIRA issue exists that's linked to '{issue['url']}'"
-            )
-            issue_exists = self._jira_issue_linked_to_gh_issue(issue['url'])
-            if issue_exists:
-                self._logger.info(f'Skipping issue {issue["number"]}')
-                continue
-            labels = [
-                label['name'].replace(" ", "-") for label in issue["labels"]
-            ]
-            issue_type = "Bug" if 'kind/bug' in labels else "Task"
-            assignee = None
-            if len(issue["assignees"]) > 0:
-                assignee = self._mapped_users.get(
-                    issue["assignees"][0]["login"], self._null_panda_user)
-
-            issue_body = self._ghm_to_jira(issue["body"])
-
-            issue_cut_off = len(issue_body) > JIRA_ISSUE_CHARACTER_LIMIT
-
-            self._logger.debug(
-                f'Creating issue of type {issue_type} titled "{issue["title"]}" with labels "{labels}"'
-            )
-            response = self._create_issue(
-                issue_body[:JIRA_ISSUE_CHARACTER_LIMIT], issue["title"],
-                issue_type, labels, self._jira_project, issue["url"], assignee)
-
-            if assignee is not None and response is None:
-                self._logger.debug(
-                    f'Resubmitting creation of issue with no assignee due to error'
-                )
-                response = self._create_issue(
-                    issue_body[:JIRA_ISSUE_CHARACTER_LIMIT], issue["title"],
-                    issue_type, labels, self._jira_project, issue["url"], None)
-
-            if response is None:
-                raise RuntimeError("Failed to create issue")
-
-            issue_key = response['key']
-            issue_id = response['id']
-            message = """
-JIRA Issue created from GitHub issue.  Any updates in JIRA will _not_ be pushed back
-to the GitHub issue.  New comments from GitHub will sync with JIRA issue, but not
-modifications.  Please refer to the External GitHub Link field to get to the GitHub
-issue that triggered this issue's creation.
-            """
-            if issue_cut_off:
-                message += """
-The issue has been truncated due to issue length limitations.
-Please refer to the original Github issue for the full issue body.
-                """
-            self._logger.debug(
-                f'Adding boilerplate message to issue {issue_key}')
-            self._add_comment_to_issue(issue_id, message)
-
-            # The backport issues that were autocreated lack the trailing ``` and so the link shows up weird
-            # within the code block so don't insert the JIRA link for kind/backports
-            insert_jira_link = 'kind/backport' not in labels and self._add_link
-
-            if insert_jira_link:
-                jira_issue_url = f'{self._jira_url}/browse/{issue_key}'
-                issue_body = issue[
-                                 "body"] + f"\n\nJIRA Link: [{issue_key}]({jira_issue_url})"
-                with tempfile.NamedTemporaryFile(delete=False) as tf:
-                    tf.write(issue_body.encode())
-                    tf.flush()
-                    tf.close()
-                    self._run_cmd_return_stdout(
-                        f"gh issue edit {issue['url']} --body-file {tf.name}")
-                    os.unlink(tf.name)
-
-            for c in reversed(issue["comments"]):
-                self._add_comment_to_issue(issue_id, c['body'])
-
-            self._logger.info(f'Successfully created JIRA Issue {issue_key}')
-
-    def _jira_issue_linked_to_gh_issue(self, gh_url) -> bool:
-        jql_request = f'project = {self._jira_project} and "External GitHub Issue[URL Field]" = "{gh_url}"'
-        resp = self._jira.jql(jql=jql_request, fields='summary')
         self._logger.debug(
-            f'Submitting request to find JIRA issue with GitHub link "{gh_url}"'
-        )
-        total_issues: int = resp["total"]
-        self._logger.debug(f'Found {total_issues} issues linked to "{gh_url}"')
-
-        return total_issues != 0
-
-    def _run_cmd_return_stdout(self, cmd: str) -> str:
-        self._logger.debug(f'Executing command "{cmd}"')
-        return subprocess.check_output(cmd.split(' ')).decode()
+            'Creating issue of type %s titled "%s" with labels "%s"',
+            issue_type, issue["title"], labels)
+        resp = self._create_issue(issue_body[:JIRA_ISSUE_CHARACTER_LIMIT],
+                                  issue["title"], issue_type, labels,
+                                  issue["url"], assignee)
+
+        if not resp.ok and assignee is not None and self._is_assignee_error(
+                resp):
+            self._logger.debug(
+                'Resubmitting creation of issue with no assignee due to error')
+            resp = self._create_issue(issue_body[:JIRA_ISSUE_CHARACTER_LIMIT],
+                                      issue["title"], issue_type, labels,
+                                      issue["url"], None)
+
+        if not resp.ok:
+            raise RuntimeError(f"Failed to create issue: {resp.text}")
+
+        response = resp.json()
+        issue_key = response['key']
+        issue_id = response['id']
+
+        # Comments go in before the Github issue is touched, so a failed Github
+        # update never leaves a Jira issue without its comments
+        boilerplate = (self._truncated_boilerplate_comment
+                       if issue_cut_off else self._boilerplate_comment)
+        self._add_comments_to_issue(issue_id, [boilerplate, *comments])
+
+        # The backport issues that were autocreated lack the trailing ``` and so the link shows up weird
+        # within the code block so don't insert the JIRA link for kind/backports
+        insert_jira_link = BACKPORT_LABEL not in label_set and self._add_link
+
+        if insert_jira_link:
+            self._add_jira_link_to_github_issue(issue, issue_key)
+
+        self._logger.info('Successfully created JIRA Issue %s', issue_key)
+
+    def _add_jira_link_to_github_issue(self, issue, issue_key: str):
+        # Built in a single pass from the raw Github body, it goes out as is:
+        # serialized by requests or piped to gh, never through pandoc again
+        body = f'{issue["body"]}\n\nJIRA Link: [{issue_key}]({self._jira_browse_url}{issue_key})'
+        if self._gh_session is not None:
+            resp = self._gh_session.patch(
+                f'{self._gh_issues_url}/{issue["number"]}',
+                json={"body": body},
+                timeout=HTTP_TIMEOUT)
+            resp.raise_for_status()
+            return
+
+        # gh reads the body from stdin, so there is no temporary file to write
+        self._run_cmd(['gh', 'issue', 'edit', issue['url'], '--body-file', '-'],
+                      body)
+
+    def _log_cmd(self, cmd: List[str]):
+        # Joining the argv isn't free and pandoc runs for every issue, so only
+        # build the message when it will actually be emitted
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug('Executing command "%s"', ' '.join(cmd))
+
+    def _run_cmd(self, cmd: List[str], stdin: str) -> str:
+        self._log_cmd(cmd)
+        return subprocess.run(cmd,
+                              input=stdin.encode(),
+                              stdout=subprocess.PIPE,
+                              check=True).stdout.decode()
+
+    @staticmethod
+    def _is_assignee_error(resp: requests.Response) -> bool:
+        try:
+            return "assignee" in resp.json().get("errors", {})
+        except ValueError:
+            return False
+
+    def _find_imported_urls(self, urls: List[str]) -> Set[str]:
+        url_list = ', '.join(f'"{url}"' for url in urls)
+        jql_request = f'project = {self._jira_project} and "External GitHub Issue[URL Field]" in ({url_list})'
+        imported = set()
+        start = 0
+        while True:
+            # POSTed rather than passed in a GET query string, where a chunk of
+            # quoted, encoded URLs comes close to the usual request line limit
+            resp = self._jira.post(self._jira.resource_url("search"),
+                                   data={
+                                       "jql": jql_request,
+                                       "fields": [JIRA_GITHUB_URL_FIELD],
+                                       "startAt": start,
+                                       "maxResults": JQL_MAX_RESULTS
+                                   })
+            found = resp["issues"]
+            imported.update(issue["fields"][JIRA_GITHUB_URL_FIELD]
+                            for issue in found)
+            start += len(found)
+            if len(found) == 0 or start >= resp["total"]:
+                break
+
+        return imported
 
 
 def main() -> int:
     args = parse_args()
-    reader = csv.DictReader(args.user_mapping)
-    assert reader.fieldnames == EXPECTED_FIELD_NAMES, f'Invalid field names.  Expected {EXPECTED_FIELD_NAMES} but got {reader.fieldnames}'
+    # newline='' as the csv module expects, so quoted fields can span lines.
+    # utf-8-sig drops the BOM Excel's "CSV UTF-8" export starts with
+    with open(args.user_mapping, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.DictReader(f)
+        assert reader.fieldnames == EXPECTED_FIELD_NAMES, f'Invalid field names.  Expected {EXPECTED_FIELD_NAMES} but got {reader.fieldnames}'
+        user_mapping = list(reader)
     logger = logging.getLogger(__name__)
     logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO)
     pandoc: Optional[
@@ -266,13 +672,17 @@ def main() -> int:
                                        args.jira_token,
                                        args.jira_url,
                                        args.jira_project,
-                                       reader,
+                                       user_mapping,
                                        pandoc=pandoc,
-                                       add_link=not args.dont_add_link)
+                                       add_link=not args.dont_add_link,
+                                       github_token=args.github_token,
+                                       workers=args.workers)
     try:
         issue_importer.run()
     except RuntimeError as e:
-        logger.error(f'Failed executing issue importer: {e}')
+        logger.error('Failed executing issue importer: %s', e)
+    finally:
+        issue_importer.close()
     return 0
 
 
@@ -280,6 +690,13 @@ def find_prog(prog) -> Optional[str]:
     return shutil.which(prog)
 
 
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f'{value} is not a positive integer')
+    return number
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(prog='Github Issue Importer',
                                      description='Imports issues from github')
@@ -294,7 +711,8 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         '-l',
         '--limit',
-        help=f"limit to number of issues to fetch (default: {LIMIT_DEFAULT})",
+        help=f"limit to the newest open issues to fetch (default: {LIMIT_DEFAULT})",
+        type=int,
         default=LIMIT_DEFAULT)
     parser.add_argument('-u', '--jira-user', help="Jira User", required=True)
     parser.add_argument('-t', '--jira-token', help="Jira Token", required=True)
@@ -312,12 +730,23 @@ def parse_args() -> argparse.Namespace:
         '--user-mapping',
         help=
         'Path to the CSV file containing mapping of github user with redpanda email address',
-        required=True,
-        type=argparse.FileType('r'))
+        required=True)
     parser.add_argument('--pandoc', help='Path to pandoc executable')
     parser.add_argument('--dont-add-link',
                         help='Set this to not add the link',
                         action='store_true')
+    parser.add_argument(
+        '-w',
+        '--workers',
+        help=
+        f'Number of issues to import concurrently (default: {IMPORT_WORKERS_DEFAULT})',
+        type=positive_int,
+        default=IMPORT_WORKERS_DEFAULT)
+    parser.add_argument(
+        '--github-token',
+        help=
+        'Github token, when set the Github REST API is used instead of gh (default: $GITHUB_TOKEN)',
+        default=os.environ.get('GITHUB_TOKEN'))
     return parser.parse_args()
 
 